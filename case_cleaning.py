@@ -1,4 +1,7 @@
+import csv
 import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 import pandas as pd
 import hashlib
 import json
@@ -18,6 +21,12 @@ max_rows = config.get("max_rows", 100000)
 max_size_mb = config.get("max_size_mb", 200)
 required_columns = config.get("required_columns", [])
 rich_text_columns = config.get("rich_text_columns", [])
+max_workers = config.get("max_workers")  # None = one worker per CPU
+chunk_rows = config.get("chunk_rows", 100000)
+date_columns = config.get("date_columns", [])  # empty = detect date-like columns by sampling
+ 
+READ_BUFFER_BYTES = 4 * 1024 * 1024  # file buffer for CSV reads: fewer read() syscalls on large files
+DATE_PROBE_ROWS = 100  # non-blank values sampled per column when date_columns is not configured
  
 # ----------------- Regex Patterns -----------------
 ISO_TZ_REGEX = re.compile(r'^\s*\d{4}-\d{2}-\d{2}T.*(?:Z|[+-]\d{2}:\d{2})?\s*$')
@@ -27,110 +36,225 @@ DATE_PATTERNS = [
     re.compile(r'^\s*\d{4}[-/]\d{1,2}[-/]\d{1,2}(?:\s+\d{1,2}:\d{1,2}(?::\d{1,2})?)?\s*$'),
     re.compile(r'^\s*\d{1,2}[-.]\w{3}[-.]\d{2,4}(?:\s+\d{1,2}:\d{1,2}(?::\d{1,2})?)?\s*$', re.I)
 ]
+
+# Single alternation of ISO_TZ_REGEX and DATE_PATTERNS so a cell is matched in one pass
+DATE_REGEX = re.compile("|".join(
+    f"(?i:{pat.pattern})" if pat.flags & re.I else f"(?:{pat.pattern})"
+    for pat in [ISO_TZ_REGEX, *DATE_PATTERNS]
+))
  
 TIME_REGEX = re.compile(r'(\d{1,2}):(\d{1,2})(?::(\d{1,2}))?')
+# Hour >= 24 or minute/second >= 60: the only times _fix_invalid_time changes beyond zero-padding
+OUT_OF_RANGE_TIME_REGEX = re.compile(r'(?:2[4-9]|[3-9]\d):|:[6-9]\d')
+ 
+DATE_FORMATS = ("%d/%m/%Y %H:%M:%S", "%d/%m/%Y %H:%M", "%d/%m/%Y",
+                "%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%d")
+ 
+TWO_DIGITS = tuple(f"{v:02d}" for v in range(100))  # zero-padded 00-99, indexed by value
  
 def _clamp_2d(val_str: str, maxv: int) -> str:
-    try:
-        v = int(val_str)
-    except Exception:
-        v = 0
-    v = max(0, min(maxv, v))
-    return f"{v:02d}"
+    # TIME_REGEX only captures 1-2 digits, so int() cannot fail and the value is never negative
+    return TWO_DIGITS[min(maxv, int(val_str))]
+ 
+def _fix_time_match(m: re.Match) -> str:
+    h, mi, s = m.groups()
+    if s is None:
+        return f"{_clamp_2d(h, 23)}:{_clamp_2d(mi, 59)}"
+    return f"{_clamp_2d(h, 23)}:{_clamp_2d(mi, 59)}:{_clamp_2d(s, 59)}"
  
 def _fix_invalid_time(text: str) -> str:
-    def _repl(m: re.Match) -> str:
-        h = _clamp_2d(m.group(1), 23)
-        mi = _clamp_2d(m.group(2), 59)
-        s = m.group(3)
-        if s is not None:
-            s = _clamp_2d(s, 59)
-            return f"{h}:{mi}:{s}"
-        else:
-            return f"{h}:{mi}"
-    return TIME_REGEX.sub(_repl, str(text), count=1)
+    return TIME_REGEX.sub(_fix_time_match, text if isinstance(text, str) else str(text), count=1)
  
 def _looks_like_date(s: str) -> bool:
-    if ISO_TZ_REGEX.match(s):
-        return True
-    return any(pat.match(s) for pat in DATE_PATTERNS)
- 
-def normalize_cell(val):
-    """Normalize only if it looks like a valid date/time string."""
-    if isinstance(val, (list, pd.Series)):
-        if len(val) == 0:
-            return val
-        val = val.iloc[0] if isinstance(val, pd.Series) else val[0]
- 
-    if pd.isna(val):
-        return val
- 
-    s = str(val).strip()
-    if s == "":
-        return s
-    if not _looks_like_date(s):
-        return val
-    if ISO_TZ_REGEX.match(s):
-        return s
- 
-    s_fixed = _fix_invalid_time(s)
- 
-    for fmt in ("%d/%m/%Y %H:%M:%S", "%d/%m/%Y %H:%M", "%d/%m/%Y",
-                "%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%d"):
-        try:
-            dt = pd.to_datetime(s_fixed, format=fmt, errors='raise')
-            has_time = any(x in fmt for x in ["%H", "%M", "%S"])
-            return dt.strftime("%Y-%m-%d %H:%M:%S") if has_time else dt.strftime("%Y-%m-%d")
-        except:
-            continue
- 
-    dt = pd.to_datetime(s_fixed, errors="coerce")
-    if pd.isna(dt):
-        return val
-    has_time = (":" in s_fixed) or (dt.hour or dt.minute or dt.second)
-    return dt.strftime("%Y-%m-%d %H:%M:%S") if has_time else dt.strftime("%Y-%m-%d")
+    return DATE_REGEX.match(s) is not None
+ 
+def normalize_series(series: pd.Series) -> pd.Series:
+    """Normalize the date-like values of a whole column, parsing each distinct value only once."""
+    codes, uniques = pd.factorize(series)
+    if len(uniques) == len(series):
+        return _normalize_values(series)
+    normalized = _normalize_values(pd.Series(uniques, dtype=object)).to_numpy(dtype=object)
+    result = series.astype(object).copy()
+    present = codes >= 0  # factorize codes NaN as -1; those cells stay untouched
+    result[present] = normalized[codes[present]]
+    return result
+ 
+def _normalize_values(series: pd.Series) -> pd.Series:
+    s = series.astype("string").str.strip()
+    result = series.astype(object)
+ 
+    # One null/blank mask per column; NaN stays untouched and blanks become ""
+    present = s.str.len().gt(0).fillna(False).astype(bool)
+    result[~present & series.notna()] = ""
+ 
+    # Regexes only see non-blank values, and ISO_TZ_REGEX only the ones DATE_REGEX accepted
+    s = s[present]
+    s = s[s.str.match(DATE_REGEX).astype(bool)]
+    iso_mask = s.str.match(ISO_TZ_REGEX).astype(bool)
+    result[iso_mask.index[iso_mask]] = s[iso_mask].astype(object)
+ 
+    s_fixed = s[~iso_mask].astype(object)
+    if s_fixed.empty:
+        return result
+    with_time = s_fixed.str.contains(":", regex=False)
+    # Padding alone never changes how a value parses, so only clamp values with an out-of-range part
+    needs_fix = with_time & s_fixed.str.contains(OUT_OF_RANGE_TIME_REGEX)
+    s_fixed[needs_fix] = s_fixed[needs_fix].map(_fix_invalid_time)
+ 
+    parsed = pd.Series(pd.NaT, index=s_fixed.index, dtype="datetime64[ns]")
+    for fmt in DATE_FORMATS:
+        todo = parsed.isna()
+        if not todo.any():
+            break
+        attempt = pd.to_datetime(s_fixed[todo], format=fmt, errors="coerce")
+        ok = attempt.index[attempt.notna()]
+        parsed[ok] = attempt[ok]
+ 
+    todo = parsed.isna()
+    if todo.any():
+        attempt = pd.to_datetime(s_fixed[todo], format="mixed", errors="coerce")
+        ok = attempt.index[attempt.notna()]
+        parsed[ok] = attempt[ok]
+ 
+    # Every DATE_PATTERNS time part contains ":", so the input string alone says whether to keep the time
+    ok = parsed.notna()
+    timed, dated = parsed[ok & with_time], parsed[ok & ~with_time]
+    result[timed.index] = timed.dt.strftime("%Y-%m-%d %H:%M:%S")
+    result[dated.index] = dated.dt.strftime("%Y-%m-%d")
+    return result
+ 
+def _blank_to_empty(series: pd.Series) -> pd.Series:
+    """Turn whitespace-only cells into "", the only change normalize_series makes to a non-date value."""
+    blank = series.str.isspace().eq(True)  # NaN -> False
+    return series.mask(blank, "") if blank.any() else series
+ 
+def normalize_columns(df, columns=None, executor=None, parse_columns=None):
+    """Normalize columns (default: all) into a new frame, one column per worker process when an executor is given.
+
+    When parse_columns is given, only those columns go through normalize_series; the
+    rest just have whitespace-only cells blanked, skipping the regex and parsing work.
+    """
+    columns = list(df.columns) if columns is None else columns
+    if parse_columns is None:
+        parse_columns = columns
+    to_parse = [c for c in columns if c in parse_columns]
+    series = [df[c] for c in to_parse]
+    if executor is None or len(series) < 2:
+        parsed = [normalize_series(col) for col in series]
+    else:
+        parsed = list(executor.map(normalize_series, series))
+    parsed = dict(zip(to_parse, parsed))
+    normalized = [parsed[c] if c in parsed else _blank_to_empty(df[c]) for c in columns]
+    if not normalized:
+        return pd.DataFrame(index=df.index)
+    return pd.concat(normalized, axis=1)
  
 # ----------------- Split CSV -----------------
-def split_csv(df, base_name, output_dir, max_rows=10000, max_size_mb=10):
-    rows = len(df)
-    part = 1
-    start = 0
-    max_allowed_size = max_size_mb * 0.99  # Keep under 9.9 MB for a 10 MB limit
- 
-    print(f"File Size: {df.memory_usage(deep=True).sum() / (1024 * 1024):.2f} MB | Total Rows: {rows}")
- 
-    while start < rows:
-        end = min(start + max_rows, rows)
-        chunk = df.iloc[start:end]
- 
-        output_file = os.path.join(output_dir, f"{base_name}_part{part}.csv")
-        chunk.to_csv(output_file, index=False, encoding="utf-8")
- 
-        size_mb = os.path.getsize(output_file) / (1024 * 1024)
+class _CsvLine:
+    """File-like target for csv.writer that keeps the last formatted row as UTF-8 bytes."""
+    def write(self, text):
+        self.data = text.encode("utf-8")
  
-        # Reduce rows until file size < max_allowed_size
-        while size_mb > max_allowed_size and (end - start) > 1:
-            overshoot_factor = size_mb / max_allowed_size
-            new_chunk_size = int((end - start) / overshoot_factor)
-            if new_chunk_size < 1:
-                new_chunk_size = 1
- 
-            end = start + new_chunk_size
-            chunk = df.iloc[start:end]
-            chunk.to_csv(output_file, index=False, encoding="utf-8")
-            size_mb = os.path.getsize(output_file) / (1024 * 1024)
- 
-        print(f"✅ Saved {output_file} ({size_mb:.2f} MB, {len(chunk)} rows)")
+class _PartWriter:
+    """Streams CSV rows into numbered part files, rolling over before max_rows or max_bytes is exceeded.
+
+    When copy_to is given, the header and every row are also written there, so the
+    cleaned file and the parts share one formatting pass.
+    """
+ 
+    def __init__(self, base_name, output_dir, max_rows, max_bytes, copy_to=None):
+        self.base_name = base_name
+        self.output_dir = output_dir
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.copy_to = copy_to
+        self.line = _CsvLine()
+        # Same dialect as DataFrame.to_csv, so parts read back exactly like the cleaned file
+        self.writer = csv.writer(self.line, lineterminator=os.linesep)
+        self.header = None
+        self.fp = None
+        self.part = 0
+ 
+    def write_chunk(self, chunk):
+        if self.header is None:
+            self.writer.writerow(chunk.columns)
+            self.header = self.line.data
+            if self.copy_to is not None:
+                self.copy_to.write(self.header)
+        for row in chunk.to_numpy(dtype=object, na_value="").tolist():
+            self.writer.writerow(row)
+            data = self.line.data
+            if (self.fp is None or self.rows >= self.max_rows
+                    or (self.rows and self.size + len(data) > self.max_bytes)):
+                self._next_part()
+            self.fp.write(data)
+            if self.copy_to is not None:
+                self.copy_to.write(data)
+            self.size += len(data)
+            self.rows += 1
+ 
+    def _next_part(self):
+        self.close()
+        self.part += 1
+        self.output_file = os.path.join(self.output_dir, f"{self.base_name}_part{self.part}.csv")
+        self.fp = open(self.output_file, "wb", buffering=1 << 20)
+        self.fp.write(self.header)
+        self.size = len(self.header)
+        self.rows = 0
+ 
+    def close(self):
+        if self.fp is not None:
+            self.fp.close()
+            self.fp = None
+            print(f"✅ Saved {self.output_file} ({self.size / (1024 * 1024):.2f} MB, {self.rows} rows)")
+ 
+def split_csv(chunks, base_name, output_dir, max_rows=10000, max_size_mb=10, copy_to=None):
+    """Split a stream of DataFrame chunks into part files as the rows arrive, optionally copying every row to copy_to."""
+    rows = 0
+    mem_bytes = 0
+    max_allowed_bytes = max_size_mb * 0.99 * 1024 * 1024  # Keep under 9.9 MB for a 10 MB limit
+ 
+    parts = _PartWriter(base_name, output_dir, max_rows, max_allowed_bytes, copy_to)
+    try:
+        for chunk in chunks:
+            rows += len(chunk)
+            mem_bytes += chunk.memory_usage(deep=True).sum()
+            parts.write_chunk(chunk)
+    finally:
+        parts.close()
  
-        start = end
-        part += 1
+    print(f"File Size: {mem_bytes / (1024 * 1024):.2f} MB | Total Rows: {rows}")
  
 # ----------------- Validation -----------------
-def hash_row(row):
-    row_str = "|".join(str(v) if pd.notna(v) else "NULL" for v in row)
-    return hashlib.md5(row_str.encode()).hexdigest()
- 
-def validate_data(cleaned_file, split_dir, report_file):
+def hash_rows(df):
+    """64-bit BLAKE2b of every row, joining the columns with "|" and writing NaN as "NULL".
+
+    Only used for set equality between the cleaned file and its splits, so the
+    digest is returned as an int (cheaper to store and compare than hex strings).
+    """
+    values = df.fillna("NULL").astype(str)
+    if values.shape[1] == 0:
+        joined = [""] * len(values)
+    else:
+        joined = values.iloc[:, 0].str.cat([values.iloc[:, i] for i in range(1, values.shape[1])], sep="|").tolist()
+    blake2b, from_bytes = hashlib.blake2b, int.from_bytes  # local names: no attribute lookups per row
+    return [
+        from_bytes(blake2b(row_str.encode(), digest_size=8, usedforsecurity=False).digest(), "little")
+        for row_str in joined
+    ]
+ 
+def _hash_csv(path):
+    """Read a CSV in chunks and return (rows, columns, row hashes)."""
+    rows, columns, hashes = 0, None, set()
+    with open(path, "rb", buffering=READ_BUFFER_BYTES) as fp, \
+            pd.read_csv(fp, dtype=str, encoding="utf-8", chunksize=chunk_rows) as reader:
+        for chunk in reader:
+            rows += len(chunk)
+            columns = list(chunk.columns)
+            hashes.update(hash_rows(chunk))
+    return rows, columns, hashes
+ 
+def validate_data(cleaned_file, split_dir, report_file, executor=None):
     report_lines = []
  
     def log(msg):
@@ -138,22 +262,23 @@ def validate_data(cleaned_file, split_dir, report_file):
         report_lines.append(msg)
  
     log("\n===== VALIDATION REPORT =====")
-    df_original = pd.read_csv(cleaned_file, dtype=str, encoding="utf-8")
-    orig_rows, orig_cols = df_original.shape
-    log(f"{os.path.basename(cleaned_file)}: {orig_rows} rows, {orig_cols} cols, {os.path.getsize(cleaned_file)/(1024*1024):.2f} MB")
-    orig_hashes = set(df_original.apply(hash_row, axis=1))
+    # scandir returns each part's size with the listing (no extra stat call per file on Windows)
+    with os.scandir(split_dir) as it:
+        split_files = [entry for entry in it if entry.name.endswith(".csv")]
+    paths = [cleaned_file] + [entry.path for entry in split_files]
+    # Hash the cleaned file and every split concurrently when an executor is given
+    results = executor.map(_hash_csv, paths) if executor is not None else map(_hash_csv, paths)
+ 
+    orig_rows, orig_columns, orig_hashes = next(results)
+    log(f"{os.path.basename(cleaned_file)}: {orig_rows} rows, {len(orig_columns)} cols, {os.path.getsize(cleaned_file)/(1024*1024):.2f} MB")
  
-    split_files = [f for f in os.listdir(split_dir) if f.endswith(".csv")]
     combined_rows, combined_hashes = 0, set()
-    for f in split_files:
-        path = os.path.join(split_dir, f)
-        df_split = pd.read_csv(path, dtype=str, encoding="utf-8")
-        rows, cols = df_split.shape
+    for entry, (rows, columns, hashes) in zip(split_files, results):
         combined_rows += rows
-        if list(df_split.columns) != list(df_original.columns):
-            log(f"❌ Column mismatch in {f} (expected {len(df_original.columns)} cols, found {len(df_split.columns)} cols)")
-        combined_hashes.update(df_split.apply(hash_row, axis=1))
-        log(f"{f}: {rows} rows, {cols} cols, {os.path.getsize(path)/(1024*1024):.2f} MB")
+        if columns != orig_columns:
+            log(f"❌ Column mismatch in {entry.name} (expected {len(orig_columns)} cols, found {len(columns)} cols)")
+        combined_hashes.update(hashes)
+        log(f"{entry.name}: {rows} rows, {len(columns)} cols, {entry.stat().st_size/(1024*1024):.2f} MB")
  
     log(f"\nOriginal rows: {orig_rows} | Split total rows: {combined_rows}")
     log("✅ Row count matches." if orig_rows == combined_rows else "❌ Row count mismatch!")
@@ -165,59 +290,109 @@ def validate_data(cleaned_file, split_dir, report_file):
     print(f"\n📄 Validation report saved at: {report_file}")
  
 # ----------------- Main -----------------
+def iter_source_chunks(path, encoding):
+    """Yield the source CSV as DataFrames of at most chunk_rows rows."""
+    # Python engine only: with chunksize, the C parser does not skip an over-long line that starts a chunk
+    with open(path, "rb", buffering=READ_BUFFER_BYTES) as fp, \
+            pd.read_csv(fp, dtype=str, on_bad_lines='skip', engine='python', encoding=encoding,
+                        chunksize=chunk_rows) as reader:
+        yield from reader
+ 
+def scan_source(path, encoding):
+    """Full pass over the source returning (required columns that hold a value, date-like columns among them)."""
+    columns, has_data, samples = None, None, None
+    for chunk in iter_source_chunks(path, encoding):
+        if columns is None:
+            # ✅ Keep only required columns that exist in source
+            columns = [c for c in required_columns if c in chunk.columns] if required_columns else list(chunk.columns)
+            has_data = np.zeros(len(columns), dtype=bool)
+            samples = [[] for _ in columns]
+        chunk = chunk[columns]
+        # Single pass per column: NaN and whitespace-only both count as empty
+        for i in np.flatnonzero(~has_data):
+            has_data[i] = chunk.iloc[:, i].fillna('').str.strip().ne('').any()
+        if not date_columns:
+            for i, sample in enumerate(samples):
+                need = DATE_PROBE_ROWS - len(sample)
+                if need > 0:
+                    values = chunk.iloc[:, i].dropna().str.strip()
+                    sample.extend(values[values.ne('')].head(need))
+ 
+    # ❌ Remove completely empty columns
+    kept = [i for i, keep in enumerate(has_data) if keep]
+    if date_columns:
+        dates = [columns[i] for i in kept if columns[i] in date_columns]
+    else:
+        # Date-like when more than half of the sampled values match DATE_REGEX
+        dates = [columns[i] for i in kept if 2 * sum(map(_looks_like_date, samples[i])) > len(samples[i])]
+    return [columns[i] for i in kept], dates
+ 
+def output_columns(columns):
+    """Cleaned-file header for the kept source columns ("Id" becomes "Legacy_SF_Record_ID__c")."""
+    return ["Legacy_SF_Record_ID__c" if c == "Id" else c for c in columns]
+ 
+def quote_rich_text(series):
+    """Escape embedded quotes and wrap every value in quotes, in one pass over the column."""
+    quoted = ['"' + str(v).replace('"', '""') + '"' for v in series]
+    return pd.Series(quoted, index=series.index, name=series.name, dtype=object)
+ 
+def clean_chunk(df, columns, date_cols, executor=None):
+    """Select, normalize, quote and rename one source chunk, building a single new frame."""
+    # Normalize date-like fields; this also selects the kept columns without an extra copy
+    df = normalize_columns(df, columns, executor, date_cols)
+ 
+    # Wrap Rich Text fields in quotes and escape internal quotes
+    for col in rich_text_columns:
+        if col in df.columns:
+            df[col] = quote_rich_text(df[col])
+ 
+    # Rename "Id" column to "Legacy_SF_Record_ID__c" if present (in place, the frame is ours)
+    df.columns = output_columns(df.columns)
+    return df
+ 
 def main():
     print("===== DATA MIGRATION STARTED =====")
  
+    encoding = 'utf-8'
     try:
-        df = pd.read_csv(input_file, dtype=str, on_bad_lines='skip', engine='python', encoding='utf-8')
+        columns, date_cols = scan_source(input_file, encoding)
     except UnicodeDecodeError:
         print("⚠ UTF-8 failed, trying ISO-8859-1 to preserve all data")
-        df = pd.read_csv(input_file, dtype=str, on_bad_lines='skip', engine='python', encoding='ISO-8859-1')
+        encoding = 'ISO-8859-1'
+        columns, date_cols = scan_source(input_file, encoding)
  
     except Exception as e:
         print(f"❌ Failed to read CSV: {e}")
         return
  
-    # ✅ Keep only required columns that exist in source
-    if required_columns:
-        existing_cols = [c for c in required_columns if c in df.columns]
-        df = df[existing_cols]
- 
-    # ❌ Remove completely empty columns
-    df = df.dropna(axis=1, how='all')  # remove columns where all values are NaN
-    df = df.loc[:, ~(df.apply(lambda x: x.astype(str).str.strip().eq('').all()))]
- 
-    # Normalize date-like fields
-    for col in df.columns:
-        df[col] = df[col].apply(normalize_cell)
- 
-    # Wrap Rich Text fields in quotes and escape internal quotes
-    for col in rich_text_columns:
-        if col in df.columns:
-            df[col] = df[col].astype(str).str.replace('"', '""', regex=False)
-            df[col] = '"' + df[col] + '"'
- 
-    # Rename "Id" column to "Legacy_SF_Record_ID__c" if present
-    if "Id" in df.columns:
-        df.rename(columns={"Id": "Legacy_SF_Record_ID__c"}, inplace=True)
-    else:
+    if "Id" not in columns:
         print("⚠ 'Id' column not found...check Id column.")
+    print(f"📅 Normalizing {len(date_cols)} date-like column(s): {', '.join(date_cols)}")
 
-    # Save cleaned file
-    df.to_csv(cleaned_file, index=False, encoding="utf-8")
-    print(f"✅ Cleaned file saved at: {cleaned_file}")
- 
     # Clean and recreate split_dir
     if os.path.exists(split_dir):
         shutil.rmtree(split_dir)
     os.makedirs(split_dir, exist_ok=True)
  
-    # Split
-    base_name = os.path.splitext(os.path.basename(cleaned_file))[0]
-    split_csv(df, base_name, split_dir, max_rows=max_rows, max_size_mb=max_size_mb)
+    def cleaned_chunks(executor):
+        for chunk in iter_source_chunks(input_file, encoding):
+            yield clean_chunk(chunk, columns, date_cols, executor)
  
-    # Validate
-    validate_data(cleaned_file, split_dir, report_file)
+    # Clean, save and split chunk by chunk; each row is formatted once for both the cleaned file and its part
+    # (the reader always yields at least one chunk, even for a header-only source, so the header is written)
+    base_name = os.path.splitext(os.path.basename(cleaned_file))[0]
+    executor = None if max_workers == 1 else ProcessPoolExecutor(max_workers=max_workers)
+    try:
+        with open(cleaned_file, "wb", buffering=1 << 20) as cleaned_fp:
+            split_csv(cleaned_chunks(executor), base_name, split_dir, max_rows=max_rows, max_size_mb=max_size_mb,
+                      copy_to=cleaned_fp)
+        print(f"✅ Cleaned file saved at: {cleaned_file}")
+ 
+        # Validate
+        validate_data(cleaned_file, split_dir, report_file, executor)
+    finally:
+        if executor is not None:
+            executor.shutdown()
     print("===== DATA MIGRATION COMPLETED =====")
  
 if __name__ == "__main__":